@@ -1,6 +1,7 @@
 # Cavern - Actor Classes
 # All game entities with dependency injection for game reference
 
+from bisect import bisect_left
 from random import choice, randint, random
 from pgzero.actor import Actor
 
@@ -10,6 +11,116 @@ from constants import (
 from utils import block, sign
 
 
+# Larger than any colliding actor sprite (orbs and robots are at most
+# 75 pixels across), so two actors whose rects are further apart than
+# this on either axis can't be touching
+BROAD_PHASE_RANGE = 80
+
+# Sprite image names, built once so that choosing an actor's image each
+# frame is a table lookup rather than string building.
+# Indexed as [type][direction][frame], where direction is 0 for left and
+# 1 for right.
+ORB_IMAGES = ["orb%d" % frame for frame in range(7)]
+TRAP_IMAGES = [["trap%d%d" % (enemy_type, frame) for frame in range(8)]
+               for enemy_type in range(2)]
+BOLT_IMAGES = [["bolt%d%d" % (direction, frame) for frame in range(2)]
+               for direction in range(2)]
+POP_IMAGES = [["pop%d%d" % (pop_type, frame) for frame in range(7)]
+              for pop_type in range(2)]
+# Fruit animation cycles through frames 0, 1, 2, 1 - indexed by step
+FRUIT_IMAGES = [["fruit%d%d" % (fruit_type, frame) for frame in (0, 1, 2, 1)]
+                for fruit_type in range(5)]
+RECOIL_IMAGES = ["recoil0", "recoil1"]
+FALL_IMAGES = ["fall0", "fall1"]
+BLOW_IMAGES = ["blow0", "blow1"]
+RUN_IMAGES = [["run%d%d" % (direction, frame) for frame in range(4)]
+              for direction in range(2)]
+ROBOT_IMAGES = [[["robot%d%d%d" % (robot_type, direction, frame)
+                  for frame in range(8)]
+                 for direction in range(2)]
+                for robot_type in range(2)]
+
+
+def _set_image(actor, image):
+    """
+    Change an actor's image, skipping the work if it is unchanged.
+    
+    Assigning Actor.image reloads the surface and recalculates the
+    anchor and position, while most actors keep the same image for
+    several frames at a time.
+    
+    Args:
+        actor: Actor to update
+        image: Name of the image to show
+    """
+    if actor._image_name != image:
+        actor.image = image
+
+
+def _sweep(x, y, dx, dy, speed, grid, _block=block):
+    """
+    Work out how far an actor can move before colliding.
+    
+    Behaves as if movement is done 1 pixel at a time to prevent
+    embedding in walls, but only the pixels where a collision can
+    actually happen are examined: the first pixel outside the level
+    boundaries and the pixels where a grid block edge is crossed.
+    
+    Args:
+        x: Starting X coordinate (integer)
+        y: Starting Y coordinate (integer)
+        dx: X direction (-1, 0, or 1)
+        dy: Y direction (-1, 0, or 1)
+        speed: Number of pixels to move
+        grid: The current level grid, as returned by flatten_grid()
+        _block: Not for callers; binds utils.block as a fast local
+    
+    Returns:
+        Tuple of (pixels that can be moved, True if a collision occurred)
+    """
+    size = GRID_BLOCK_SIZE
+    
+    # Number of pixels that can be moved before stopping
+    limit = speed
+    collided = False
+    
+    # Find the first step that would leave the level boundaries
+    if dx > 0:
+        out_step = 1 if x + 1 < 70 else max(1, 731 - x)
+    elif dx < 0:
+        out_step = 1 if x - 1 > 730 else max(1, x - 69)
+    else:
+        out_step = 1 if x < 70 or x > 730 else speed + 1
+    if out_step <= limit:
+        limit = out_step - 1
+        collided = True
+    
+    # Steps at which a block edge is crossed in each axis
+    # (speed + 1 means never within this move)
+    if dx > 0:
+        next_x = size - x % size
+    elif dx < 0:
+        next_x = x % size + 1
+    else:
+        next_x = speed + 1
+    next_y = size - y % size if dy > 0 else speed + 1
+    
+    # Jump from one block edge to the next, checking only there
+    step = min(next_x, next_y)
+    while step <= limit:
+        if _block(x + dx * step, y + dy * step, grid):
+            limit = step - 1
+            collided = True
+            break
+        if step == next_x:
+            next_x += size
+        if step == next_y:
+            next_y += size
+        step = min(next_x, next_y)
+    
+    return limit, collided
+
+
 class CollideActor(Actor):
     """
     Base actor class with collision detection.
@@ -18,6 +129,8 @@ class CollideActor(Actor):
     All actors that need collision detection should inherit from this.
     """
     
+    __slots__ = ('game',)
+    
     def __init__(self, pos, game, anchor=ANCHOR_CENTRE):
         """
         Initialize a CollideActor.
@@ -34,7 +147,8 @@ class CollideActor(Actor):
         """
         Move the actor with collision detection.
         
-        Movement is done 1 pixel at a time to prevent embedding in walls.
+        Movement stops at the last pixel before a wall or block, as if
+        done 1 pixel at a time (see _sweep).
         
         Args:
             dx: X direction (-1, 0, or 1)
@@ -44,25 +158,19 @@ class CollideActor(Actor):
         Returns:
             True if collision occurred, False otherwise
         """
-        new_x, new_y = int(self.x), int(self.y)
+        # Work on the underlying rect directly: Actor's x/y/pos
+        # properties go through slow attribute delegation
+        rect = self._rect
+        anchor_x, anchor_y = self._anchor
+        x, y = int(rect.x + anchor_x), int(rect.y + anchor_y)
         
-        for i in range(speed):
-            new_x, new_y = new_x + dx, new_y + dy
-            
-            # Check level boundaries
-            if new_x < 70 or new_x > 730:
-                return True
-            
-            # Check block collisions based on movement direction
-            if ((dy > 0 and new_y % GRID_BLOCK_SIZE == 0 or
-                 dx > 0 and new_x % GRID_BLOCK_SIZE == 0 or
-                 dx < 0 and new_x % GRID_BLOCK_SIZE == GRID_BLOCK_SIZE - 1)
-                and block(new_x, new_y, self.game.grid)):
-                return True
-            
-            self.pos = new_x, new_y
+        steps, collided = _sweep(x, y, dx, dy, speed, self.game.grid_flat)
         
-        return False
+        if steps > 0:
+            rect.x = x + dx * steps - anchor_x
+            rect.y = y + dy * steps - anchor_y
+        
+        return collided
 
 
 class GravityActor(CollideActor):
@@ -73,6 +181,8 @@ class GravityActor(CollideActor):
     Used for Player, Robots, and Fruits.
     """
     
+    __slots__ = ('vel_y', 'landed')
+    
     MAX_FALL_SPEED = 10
     
     def __init__(self, pos, game):
@@ -87,29 +197,68 @@ class GravityActor(CollideActor):
         self.vel_y = 0
         self.landed = False
     
-    def update(self, detect=True):
+    def update(self, detect=True, walk_dx=0, walk_speed=0):
         """
-        Apply gravity and handle falling/landing.
+        Apply gravity and handle falling/landing, then optionally walk.
+        
+        Walking here gives the same result as calling move(walk_dx, 0,
+        walk_speed) afterwards, but the fall and the walk share a single
+        read and write of the actor's position.
         
         Args:
             detect: If True, check for block collisions while falling.
                    Set to False when player is dying to fall through.
+            walk_dx: X direction to walk after falling (-1, 0, or 1)
+            walk_speed: Number of pixels to walk (0 for no walk)
+        
+        Returns:
+            True if the walk hit a wall, False otherwise
         """
         # Apply gravity
-        self.vel_y = min(self.vel_y + 1, GravityActor.MAX_FALL_SPEED)
+        vel_y = self.vel_y = min(self.vel_y + 1, GravityActor.MAX_FALL_SPEED)
         
-        if detect:
-            if self.move(0, sign(self.vel_y), abs(self.vel_y)):
-                # Landed on a block
-                self.vel_y = 0
-                self.landed = True
-            
-            if self.top >= HEIGHT:
-                # Fell off bottom - reappear at top
-                self.y = 1
-        else:
+        if not detect:
             # No collision detection - just fall
-            self.y += self.vel_y
+            self.y += vel_y
+            return walk_speed > 0 and self.move(walk_dx, 0, walk_speed)
+        
+        rect = self._rect
+        anchor_x, anchor_y = self._anchor
+        grid = self.game.grid_flat
+        pos_x, pos_y = rect.x + anchor_x, rect.y + anchor_y
+        top = rect.y
+        moved = False
+        
+        x, y = int(pos_x), int(pos_y)
+        dy = -1 if vel_y < 0 else 1  # sign(vel_y), inlined
+        steps, landed = _sweep(x, y, 0, dy, abs(vel_y), grid)
+        if steps > 0:
+            pos_x, pos_y = x, y + dy * steps
+            top = pos_y - anchor_y
+            moved = True
+        if landed:
+            # Landed on a block
+            self.vel_y = 0
+            self.landed = True
+        
+        if top >= HEIGHT:
+            # Fell off bottom - reappear at top
+            pos_y = 1
+            moved = True
+        
+        hit_wall = False
+        if walk_speed > 0:
+            x, y = int(pos_x), int(pos_y)
+            steps, hit_wall = _sweep(x, y, walk_dx, 0, walk_speed, grid)
+            if steps > 0:
+                pos_x, pos_y = x + walk_dx * steps, y
+                moved = True
+        
+        if moved:
+            rect.x = pos_x - anchor_x
+            rect.y = pos_y - anchor_y
+        
+        return hit_wall
 
 
 class Orb(CollideActor):
@@ -120,8 +269,17 @@ class Orb(CollideActor):
     They can trap enemies and pop after a timer expires.
     """
     
+    __slots__ = ('direction_x', 'floating', 'trapped_enemy_type', 'timer',
+                 'blown_frames')
+    
     MAX_TIMER = 250
     
+    # Image for each timer value while the orb is appearing (timer < 9),
+    # then for each 8-frame step of the floating animation until it pops
+    SPAWN_IMAGES = [ORB_IMAGES[timer // 3] for timer in range(9)]
+    FLOAT_IMAGES = [ORB_IMAGES[3 + step % 4]
+                    for step in range((MAX_TIMER - 9) // 8 + 1)]
+    
     def __init__(self, pos, dir_x, game):
         """
         Initialize an Orb.
@@ -132,6 +290,18 @@ class Orb(CollideActor):
             game: Reference to the Game instance
         """
         super().__init__(pos, game)
+        self.reset(pos, dir_x)
+    
+    def reset(self, pos, dir_x):
+        """
+        Reinitialize the orb in place so it can be reused from a pool.
+        
+        Args:
+            pos: Initial (x, y) position
+            dir_x: Direction (-1 for left, 1 for right)
+        """
+        self.image = "blank"
+        self.pos = pos
         self.direction_x = dir_x
         self.floating = False
         self.trapped_enemy_type = None
@@ -148,6 +318,13 @@ class Orb(CollideActor):
         Returns:
             True if collision occurred
         """
+        # Cheap reject on the raw rects before the exact point test
+        # (Actor position attributes are slow to read)
+        rect, bolt_rect = self._rect, bolt._rect
+        if (abs(rect.x - bolt_rect.x) > BROAD_PHASE_RANGE or
+                abs(rect.y - bolt_rect.y) > BROAD_PHASE_RANGE):
+            return False
+        
         collided = self.collidepoint(bolt.pos)
         if collided:
             self.timer = Orb.MAX_TIMER - 1
@@ -169,19 +346,20 @@ class Orb(CollideActor):
             self.floating = True
         elif self.timer >= Orb.MAX_TIMER or self.y <= -40:
             # Pop the orb
-            self.game.pops.append(Pop(self.pos, 1, self.game))
+            self.game.spawn_pop(self.pos, 1)
             if self.trapped_enemy_type is not None:
-                self.game.fruits.append(Fruit(self.pos, self.game, self.trapped_enemy_type))
+                self.game.spawn_fruit(self.pos, self.trapped_enemy_type)
             self.game.play_sound("pop", 4)
         
         # Update sprite image
-        if self.timer < 9:
-            self.image = "orb" + str(self.timer // 3)
+        timer = self.timer
+        if timer < 9:
+            image = Orb.SPAWN_IMAGES[timer]
+        elif self.trapped_enemy_type is not None:
+            image = TRAP_IMAGES[self.trapped_enemy_type][(timer // 4) & 7]
         else:
-            if self.trapped_enemy_type is not None:
-                self.image = "trap" + str(self.trapped_enemy_type) + str((self.timer // 4) % 8)
-            else:
-                self.image = "orb" + str(3 + (((self.timer - 9) // 8) % 4))
+            image = Orb.FLOAT_IMAGES[(timer - 9) // 8]
+        _set_image(self, image)
 
 
 class Bolt(CollideActor):
@@ -191,6 +369,8 @@ class Bolt(CollideActor):
     Bolts travel horizontally and can damage the player or pop orbs.
     """
     
+    __slots__ = ('direction_x', 'active')
+    
     SPEED = 7
     
     def __init__(self, pos, dir_x, game):
@@ -203,6 +383,18 @@ class Bolt(CollideActor):
             game: Reference to the Game instance
         """
         super().__init__(pos, game)
+        self.reset(pos, dir_x)
+    
+    def reset(self, pos, dir_x):
+        """
+        Reinitialize the bolt in place so it can be reused from a pool.
+        
+        Args:
+            pos: Initial (x, y) position
+            dir_x: Direction (-1 for left, 1 for right)
+        """
+        self.image = "blank"
+        self.pos = pos
         self.direction_x = dir_x
         self.active = True
     
@@ -211,16 +403,19 @@ class Bolt(CollideActor):
         if self.move(self.direction_x, 0, Bolt.SPEED):
             self.active = False
         else:
-            # Check collision with orbs and player
-            for obj in self.game.orbs + [self.game.player]:
-                if obj and obj.hit_test(self):
+            # Check collision with orbs, then the player
+            for orb in self.game.orbs:
+                if orb.hit_test(self):
                     self.active = False
                     break
+            else:
+                player = self.game.player
+                if player and player.hit_test(self):
+                    self.active = False
         
         # Update sprite image
-        direction_idx = "1" if self.direction_x > 0 else "0"
-        anim_frame = str((self.game.timer // 4) % 2)
-        self.image = "bolt" + direction_idx + anim_frame
+        direction_idx = 1 if self.direction_x > 0 else 0
+        _set_image(self, BOLT_IMAGES[direction_idx][self.game.anim4_2])
 
 
 class Pop(Actor):
@@ -230,6 +425,8 @@ class Pop(Actor):
     Displayed when orbs burst or fruits are collected.
     """
     
+    __slots__ = ('type', 'timer', 'game')
+    
     def __init__(self, pos, pop_type, game):
         """
         Initialize a Pop animation.
@@ -240,14 +437,26 @@ class Pop(Actor):
             game: Reference to the Game instance
         """
         super().__init__("blank", pos)
+        self.game = game
+        self.reset(pos, pop_type)
+    
+    def reset(self, pos, pop_type):
+        """
+        Reinitialize the pop in place so it can be reused from a pool.
+        
+        Args:
+            pos: Position (x, y)
+            pop_type: Animation type (0 or 1)
+        """
+        self.image = "blank"
+        self.pos = pos
         self.type = pop_type
         self.timer = -1
-        self.game = game
     
     def update(self):
         """Update pop animation frame."""
         self.timer += 1
-        self.image = "pop" + str(self.type) + str(self.timer // 2)
+        _set_image(self, POP_IMAGES[self.type][self.timer // 2])
 
 
 class Fruit(GravityActor):
@@ -257,6 +466,8 @@ class Fruit(GravityActor):
     Can be regular fruit (score), extra health, or extra life.
     """
     
+    __slots__ = ('type', 'time_to_live')
+    
     # Fruit types
     APPLE = 0
     RASPBERRY = 1
@@ -264,6 +475,14 @@ class Fruit(GravityActor):
     EXTRA_HEALTH = 3
     EXTRA_LIFE = 4
     
+    # Drops from normal enemies (equal chance of each)
+    NORMAL_TYPES = (APPLE, RASPBERRY, LEMON)
+    
+    # Drops from aggressive enemies, with cumulative weights out of 40:
+    # 10 each of the fruits, 9 extra health and 1 extra life
+    AGGRESSIVE_TYPES = (APPLE, RASPBERRY, LEMON, EXTRA_HEALTH, EXTRA_LIFE)
+    AGGRESSIVE_WEIGHTS = (10, 20, 30, 39, 40)
+    
     def __init__(self, pos, game, trapped_enemy_type=0):
         """
         Initialize a Fruit.
@@ -274,43 +493,59 @@ class Fruit(GravityActor):
             trapped_enemy_type: Type of enemy that spawned this fruit
         """
         super().__init__(pos, game)
+        self.reset(pos, trapped_enemy_type)
+    
+    def reset(self, pos, trapped_enemy_type=0):
+        """
+        Reinitialize the fruit in place so it can be reused from a pool.
+        
+        Args:
+            pos: Position (x, y)
+            trapped_enemy_type: Type of enemy that spawned this fruit
+        """
+        self.image = "blank"
+        self.pos = pos
+        self.vel_y = 0
+        self.landed = False
         
         # Determine fruit type based on enemy type
         if trapped_enemy_type == Robot.TYPE_NORMAL:
-            self.type = choice([Fruit.APPLE, Fruit.RASPBERRY, Fruit.LEMON])
+            self.type = choice(Fruit.NORMAL_TYPES)
         else:
             # Aggressive enemies can drop power-ups
-            types = 10 * [Fruit.APPLE, Fruit.RASPBERRY, Fruit.LEMON]
-            types += 9 * [Fruit.EXTRA_HEALTH]
-            types += [Fruit.EXTRA_LIFE]
-            self.type = choice(types)
+            roll = randint(1, Fruit.AGGRESSIVE_WEIGHTS[-1])
+            self.type = Fruit.AGGRESSIVE_TYPES[bisect_left(Fruit.AGGRESSIVE_WEIGHTS, roll)]
         
         self.time_to_live = 500
     
     def update(self):
         """Update fruit position and check for player collection."""
-        super().update()
-        
-        if self.game.player and self.game.player.collidepoint(self.center):
+        # Fruit only falls, and the level doesn't change under it, so once
+        # it has landed another gravity step would leave it where it is
+        if not self.landed:
+            super().update()
+        
+        game = self.game
+        player = game.player
+        if player and player.collidepoint(self.center):
             if self.type == Fruit.EXTRA_HEALTH:
-                self.game.player.health = min(3, self.game.player.health + 1)
-                self.game.play_sound("bonus")
+                player.health = min(3, player.health + 1)
+                game.play_sound("bonus")
             elif self.type == Fruit.EXTRA_LIFE:
-                self.game.player.lives += 1
-                self.game.play_sound("bonus")
+                player.lives += 1
+                game.play_sound("bonus")
             else:
-                self.game.player.score += (self.type + 1) * 100
-                self.game.play_sound("score")
+                player.score += (self.type + 1) * 100
+                game.play_sound("score")
             self.time_to_live = 0
         else:
             self.time_to_live -= 1
         
         if self.time_to_live <= 0:
-            self.game.pops.append(Pop((self.x, self.y - 27), 0, self.game))
+            game.spawn_pop((self.x, self.y - 27), 0)
         
         # Update sprite animation
-        anim_frame = str([0, 1, 2, 1][(self.game.timer // 6) % 4])
-        self.image = "fruit" + str(self.type) + anim_frame
+        _set_image(self, FRUIT_IMAGES[self.type][game.anim6_4])
 
 
 class Player(GravityActor):
@@ -320,6 +555,9 @@ class Player(GravityActor):
     Can move, jump, and fire orbs to trap enemies.
     """
     
+    __slots__ = ('lives', 'score', 'direction_x', 'fire_timer', 'hurt_timer',
+                 'health', 'blowing_orb')
+    
     def __init__(self, game):
         """
         Initialize the Player.
@@ -331,6 +569,14 @@ class Player(GravityActor):
         self.lives = 2
         self.score = 0
     
+    def new_game(self):
+        """Return to the state of a newly created Player, for reuse."""
+        self.image = "blank"
+        self.vel_y = 0
+        self.landed = False
+        self.lives = 2
+        self.score = 0
+    
     def reset(self):
         """Reset player state for a new level or respawn."""
         self.pos = (WIDTH / 2, 100)
@@ -408,13 +654,12 @@ class Player(GravityActor):
             if input_state.fire_pressed and self.fire_timer <= 0 and len(self.game.orbs) < 5:
                 x = min(730, max(70, self.x + self.direction_x * 38))
                 y = self.y - 35
-                self.blowing_orb = Orb((x, y), self.direction_x, self.game)
-                self.game.orbs.append(self.blowing_orb)
+                self.blowing_orb = self.game.spawn_orb((x, y), self.direction_x)
                 self.game.play_sound("blow", 4)
                 self.fire_timer = 20
             
             # Jump
-            if input_state.up and self.vel_y == 0 and self.landed:
+            if (input_state.up or input_state.jump_pressed) and self.vel_y == 0 and self.landed:
                 self.vel_y = -16
                 self.landed = False
                 self.game.play_sound("jump")
@@ -429,20 +674,21 @@ class Player(GravityActor):
             self.blowing_orb = None
         
         # Update sprite image
-        self.image = "blank"
+        image = "blank"
         if self.hurt_timer <= 0 or self.hurt_timer % 2 == 1:
-            dir_index = "1" if self.direction_x > 0 else "0"
+            dir_index = 1 if self.direction_x > 0 else 0
             if self.hurt_timer > 100:
                 if self.health > 0:
-                    self.image = "recoil" + dir_index
+                    image = RECOIL_IMAGES[dir_index]
                 else:
-                    self.image = "fall" + str((self.game.timer // 4) % 2)
+                    image = FALL_IMAGES[self.game.anim4_2]
             elif self.fire_timer > 0:
-                self.image = "blow" + dir_index
+                image = BLOW_IMAGES[dir_index]
             elif dx == 0:
-                self.image = "still"
+                image = "still"
             else:
-                self.image = "run" + dir_index + str((self.game.timer // 8) % 4)
+                image = RUN_IMAGES[dir_index][self.game.anim8_4]
+        _set_image(self, image)
 
 
 class Robot(GravityActor):
@@ -453,6 +699,9 @@ class Robot(GravityActor):
     Can be trapped in orbs.
     """
     
+    __slots__ = ('type', 'speed', 'direction_x', 'alive', 'change_dir_timer',
+                 'fire_timer')
+    
     TYPE_NORMAL = 0
     TYPE_AGGRESSIVE = 1
     
@@ -473,59 +722,82 @@ class Robot(GravityActor):
         self.change_dir_timer = 0
         self.fire_timer = 100
     
-    def update(self):
-        """Update robot movement and firing behavior."""
-        super().update()
+    def update(self, _sign=sign):
+        """
+        Update robot movement and firing behavior.
+        
+        Args:
+            _sign: Not for callers; binds utils.sign as a fast local
+        """
+        # Fall, then walk in the current direction
+        hit_wall = super().update(walk_dx=self.direction_x, walk_speed=self.speed)
         
         self.change_dir_timer -= 1
         self.fire_timer += 1
         
-        # Move and turn on wall collision
-        if self.move(self.direction_x, 0, self.speed):
+        # Turn on wall collision
+        if hit_wall:
             self.change_dir_timer = 0
         
+        # Cache values used inside the checks below (Actor attribute
+        # access is comparatively slow)
+        game = self.game
+        player = game.player
+        orbs = game.orbs
+        top, bottom = self.top, self.bottom
+        x = self.x
+        
         # Randomly change direction, biased toward player
         if self.change_dir_timer <= 0:
             directions = [-1, 1]
-            if self.game.player:
-                directions.append(sign(self.game.player.x - self.x))
+            if player:
+                directions.append(_sign(player.x - x))
             self.direction_x = choice(directions)
             self.change_dir_timer = randint(100, 250)
         
         # Aggressive robots target orbs
         if self.type == Robot.TYPE_AGGRESSIVE and self.fire_timer >= 24:
-            for orb in self.game.orbs:
-                if orb.y >= self.top and orb.y < self.bottom and abs(orb.x - self.x) < 200:
-                    self.direction_x = sign(orb.x - self.x)
+            for orb in orbs:
+                orb_x, orb_y = orb.x, orb.y
+                if orb_y >= top and orb_y < bottom and abs(orb_x - x) < 200:
+                    self.direction_x = _sign(orb_x - x)
                     self.fire_timer = 0
                     break
         
         # Fire at player
         if self.fire_timer >= 12:
-            fire_probability = self.game.fire_probability()
-            if self.game.player and self.top < self.game.player.bottom and self.bottom > self.game.player.top:
+            fire_probability = game.fire_probability()
+            if player and top < player.bottom and bottom > player.top:
                 fire_probability *= 10
             if random() < fire_probability:
                 self.fire_timer = 0
-                self.game.play_sound("laser", 4)
+                game.play_sound("laser", 4)
         elif self.fire_timer == 8:
-            self.game.bolts.append(Bolt((self.x + self.direction_x * 20, self.y - 38), 
-                                        self.direction_x, self.game))
-        
-        # Check for orb collision
-        for orb in self.game.orbs:
-            if orb.trapped_enemy_type is None and self.collidepoint(orb.center):
+            game.spawn_bolt((x + self.direction_x * 20, self.y - 38), self.direction_x)
+        
+        # Check for orb collision, rejecting distant orbs on their raw
+        # rects before the exact point test
+        collidepoint = self.collidepoint
+        rect = self._rect
+        rect_x, rect_y = rect.x, rect.y
+        for orb in orbs:
+            if orb.trapped_enemy_type is not None:
+                continue
+            orb_rect = orb._rect
+            if (abs(orb_rect.x - rect_x) > BROAD_PHASE_RANGE or
+                    abs(orb_rect.y - rect_y) > BROAD_PHASE_RANGE):
+                continue
+            if collidepoint(orb.center):
                 self.alive = False
                 orb.floating = True
                 orb.trapped_enemy_type = self.type
-                self.game.play_sound("trap", 4)
+                game.play_sound("trap", 4)
                 break
         
         # Update sprite image
-        direction_idx = "1" if self.direction_x > 0 else "0"
-        image = "robot" + str(self.type) + direction_idx
+        direction_idx = 1 if self.direction_x > 0 else 0
         if self.fire_timer < 12:
-            image += str(5 + (self.fire_timer // 4))
+            frame = 5 + (self.fire_timer // 4)
         else:
-            image += str(1 + ((self.game.timer // 4) % 4))
-        self.image = image
+            frame = 1 + self.game.anim4_4
+        _set_image(self, ROBOT_IMAGES[self.type][direction_idx][frame])
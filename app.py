@@ -1,6 +1,11 @@
 # Cavern - Application Controller
 # Manages screen transitions and delegates update/draw
 
+from game import Game
+from actors import Player
+from screens.registry import SCREENS
+
+
 class App:
     """
     Main application controller.
@@ -8,12 +13,48 @@ class App:
     Implements the State pattern by owning the current screen
     and delegating update() and draw() calls to it.
     
-    Screen transitions are handled via change_screen().
+    Screen transitions are handled via change_screen(), or
+    change_screen_by_name() to create the new screen from the registry.
+    
+    Also owns the Game and Player, which screens reuse through
+    new_game() rather than allocating new ones on every transition.
     """
     
     def __init__(self):
         """Initialize the app with no current screen."""
         self.current_screen = None
+        
+        # Created on first use by new_game()
+        self._game = None
+        self._player = None
+    
+    def new_game(self, with_player):
+        """
+        Reset the shared Game for a new game and return it.
+        
+        Any screen still showing the previous game is replaced by the
+        caller, so reusing the same objects is safe.
+        
+        Args:
+            with_player: True to include the shared Player (gameplay),
+                        False for a background game (menu)
+        
+        Returns:
+            The shared Game instance
+        """
+        player = None
+        if with_player:
+            if self._player is None:
+                self._player = Player(game=None)
+            else:
+                self._player.new_game()
+            player = self._player
+        
+        if self._game is None:
+            self._game = Game(player=player)
+        else:
+            self._game.reset(player)
+        return self._game
     
     def change_screen(self, screen):
         """
@@ -26,6 +67,16 @@ class App:
         """
         self.current_screen = screen
     
+    def change_screen_by_name(self, name, *args):
+        """
+        Create a screen from the registry and switch to it.
+        
+        Args:
+            name: Registry name of the screen ("menu", "play" or "game_over")
+            *args: Extra arguments for the screen's constructor, after app
+        """
+        self.change_screen(SCREENS[name](self, *args))
+    
     def update(self, input_state):
         """
         Update the current screen.
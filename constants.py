@@ -48,6 +48,11 @@ LEVELS = [
      "", "", ""]
 ]
 
+# Levels with their first row repeated as an extra last row, as the game
+# grid is set up. Built once here; the game shares these lists rather
+# than copying them on every level change.
+WRAPPED_LEVELS = [level + [level[0]] for level in LEVELS]
+
 # Font character widths (A-Z)
 CHAR_WIDTH = [27, 26, 25, 26, 25, 25, 26, 25, 12, 26, 26, 25, 33, 25, 26,
               25, 27, 26, 26, 25, 26, 26, 38, 25, 25, 25]
@@ -3,11 +3,60 @@
 
 from random import randint, shuffle
 
+from pgzero import loaders
+
 from constants import (
     WIDTH, HEIGHT, NUM_ROWS, NUM_COLUMNS,
-    LEVEL_X_OFFSET, GRID_BLOCK_SIZE, LEVELS
+    LEVEL_X_OFFSET, GRID_BLOCK_SIZE, WRAPPED_LEVELS
 )
-from actors import Robot, Fruit, Pop
+from actors import Robot, Fruit, Pop, Orb, Bolt
+from utils import flatten_grid
+
+
+# Flat grids for block(), one per level layout
+_FLAT_LEVELS = [flatten_grid(level) for level in WRAPPED_LEVELS]
+
+
+def _compact(items, keep, pool=None):
+    """
+    Remove items from a list in place, preserving order.
+    
+    Args:
+        items: List to filter
+        keep: Function returning True for items that should remain
+        pool: Optional list that receives the removed items for reuse
+    """
+    write = 0
+    for item in items:
+        if keep(item):
+            items[write] = item
+            write += 1
+        elif pool is not None:
+            pool.append(item)
+    del items[write:]
+
+
+# Predicates for _compact(), defined once rather than as lambdas
+# created on every frame
+
+def _fruit_alive(fruit):
+    return fruit.time_to_live > 0
+
+
+def _bolt_alive(bolt):
+    return bolt.active
+
+
+def _enemy_alive(enemy):
+    return enemy.alive
+
+
+def _pop_alive(pop):
+    return pop.timer < 12
+
+
+def _orb_alive(orb):
+    return orb.timer < 250 and orb.y > -40
 
 
 class Game:
@@ -15,7 +64,8 @@ class Game:
     Core game state and logic.
     
     Manages the level grid, all game entities, and game progression.
-    This class is owned by screen objects, not global scope.
+    A single instance is owned by the App (not global scope), which
+    calls reset() to start each new game for the menu and play screens.
     """
     
     def __init__(self, player=None):
@@ -25,10 +75,6 @@ class Game:
         Args:
             player: Player object to use, or None for menu background
         """
-        self.player = player
-        self.level_colour = -1
-        self.level = -1
-        
         # Entity lists
         self.fruits = []
         self.bolts = []
@@ -37,8 +83,46 @@ class Game:
         self.orbs = []
         self.pending_enemies = []
         self.grid = []
+        self.grid_flat = b""
         self.timer = -1
         
+        # Animation frames shared by all actors, updated once per frame
+        # from the timer: animN_M advances every N frames and cycles
+        # through M frames
+        self.anim4_2 = 0
+        self.anim4_4 = 0
+        self.anim6_4 = 0
+        self.anim8_4 = 0
+        
+        # Level blocks to draw, computed once per level
+        self._block_sprite = None
+        self._block_positions = []
+        
+        # Reused each frame to collect (surface, position) pairs to draw
+        self._blit_buffer = []
+        
+        # Pools of finished entities, recycled by the spawn_* methods
+        self._fruit_pool = []
+        self._bolt_pool = []
+        self._pop_pool = []
+        self._orb_pool = []
+        
+        self.reset(player)
+    
+    def reset(self, player=None):
+        """
+        Start a new game from the first level.
+        
+        Entity lists, pools and buffers are kept and reused.
+        
+        Args:
+            player: Player object to use, or None for menu background
+        """
+        self.player = player
+        self.level_colour = -1
+        self.level = -1
+        self.anim4_2 = self.anim4_4 = self.anim6_4 = self.anim8_4 = 0
+        
         self.next_level()
     
     def fire_probability(self):
@@ -64,20 +148,36 @@ class Game:
         self.level_colour = (self.level_colour + 1) % 4
         self.level += 1
         
-        # Set up grid (copy to avoid modifying LEVELS)
-        self.grid = LEVELS[self.level % len(LEVELS)] + [LEVELS[self.level % len(LEVELS)][0]]
+        # Set up grid (shared with WRAPPED_LEVELS, which is never modified)
+        layout = self.level % len(WRAPPED_LEVELS)
+        self.grid = WRAPPED_LEVELS[layout]
+        self.grid_flat = _FLAT_LEVELS[layout]
+        
+        # The level doesn't change until the next call, so work out where
+        # its blocks are drawn now rather than scanning the grid each frame
+        self._block_sprite = "block" + str(self.level % 4)
+        self._block_positions = [
+            (LEVEL_X_OFFSET + col * GRID_BLOCK_SIZE, row * GRID_BLOCK_SIZE)
+            for row, line in enumerate(self.grid[:NUM_ROWS])
+            for col, block_char in enumerate(line)
+            if block_char != ' '
+        ]
         
         self.timer = -1
         
         if self.player:
             self.player.reset()
         
-        # Clear all entities
-        self.fruits = []
-        self.bolts = []
-        self.enemies = []
-        self.pops = []
-        self.orbs = []
+        # Clear all entity lists in place, keeping pooled entities for reuse
+        self._fruit_pool.extend(self.fruits)
+        self._bolt_pool.extend(self.bolts)
+        self._pop_pool.extend(self.pops)
+        self._orb_pool.extend(self.orbs)
+        self.fruits.clear()
+        self.bolts.clear()
+        self.enemies.clear()
+        self.pops.clear()
+        self.orbs.clear()
         
         # Create pending enemies list
         num_enemies = 10 + self.level
@@ -101,11 +201,75 @@ class Game:
         
         for i in range(NUM_COLUMNS):
             grid_x = (r + i) % NUM_COLUMNS
-            if self.grid[0][grid_x] == ' ':
+            if self.grid_flat[grid_x] == 32:  # ord(" "), top row
                 return GRID_BLOCK_SIZE * grid_x + LEVEL_X_OFFSET + 12
         
         return WIDTH / 2
     
+    def spawn_fruit(self, pos, trapped_enemy_type=0):
+        """
+        Add a fruit, reusing a pooled one if available.
+        
+        Args:
+            pos: Position (x, y)
+            trapped_enemy_type: Type of enemy that spawned this fruit
+        """
+        if self._fruit_pool:
+            fruit = self._fruit_pool.pop()
+            fruit.reset(pos, trapped_enemy_type)
+        else:
+            fruit = Fruit(pos, self, trapped_enemy_type)
+        self.fruits.append(fruit)
+    
+    def spawn_bolt(self, pos, dir_x):
+        """
+        Add a bolt, reusing a pooled one if available.
+        
+        Args:
+            pos: Initial (x, y) position
+            dir_x: Direction (-1 for left, 1 for right)
+        """
+        if self._bolt_pool:
+            bolt = self._bolt_pool.pop()
+            bolt.reset(pos, dir_x)
+        else:
+            bolt = Bolt(pos, dir_x, self)
+        self.bolts.append(bolt)
+    
+    def spawn_pop(self, pos, pop_type):
+        """
+        Add a pop animation, reusing a pooled one if available.
+        
+        Args:
+            pos: Position (x, y)
+            pop_type: Animation type (0 or 1)
+        """
+        if self._pop_pool:
+            pop = self._pop_pool.pop()
+            pop.reset(pos, pop_type)
+        else:
+            pop = Pop(pos, pop_type, self)
+        self.pops.append(pop)
+    
+    def spawn_orb(self, pos, dir_x):
+        """
+        Add an orb, reusing a pooled one if available.
+        
+        Args:
+            pos: Initial (x, y) position
+            dir_x: Direction (-1 for left, 1 for right)
+        
+        Returns:
+            The spawned Orb
+        """
+        if self._orb_pool:
+            orb = self._orb_pool.pop()
+            orb.reset(pos, dir_x)
+        else:
+            orb = Orb(pos, dir_x, self)
+        self.orbs.append(orb)
+        return orb
+    
     def update(self, input_state):
         """
         Update all game entities.
@@ -115,35 +279,47 @@ class Game:
         """
         self.timer += 1
         
-        # Update all entities
-        for fruit in self.fruits:
+        timer = self.timer
+        self.anim4_2 = (timer // 4) & 1
+        self.anim4_4 = (timer // 4) & 3
+        self.anim6_4 = (timer // 6) & 3
+        self.anim8_4 = (timer // 8) & 3
+        
+        # Update all entities (lists bound to locals to avoid repeated
+        # attribute lookups)
+        fruits = self.fruits
+        for fruit in fruits:
             fruit.update()
         
-        for bolt in self.bolts:
+        bolts = self.bolts
+        for bolt in bolts:
             bolt.update()
         
-        for enemy in self.enemies:
+        enemies = self.enemies
+        for enemy in enemies:
             enemy.update()
         
-        for pop in self.pops:
+        pops = self.pops
+        for pop in pops:
             pop.update()
         
-        for orb in self.orbs:
+        orbs = self.orbs
+        for orb in orbs:
             orb.update()
         
         if self.player and input_state:
             self.player.update(input_state)
         
-        # Remove dead entities
-        self.fruits = [f for f in self.fruits if f.time_to_live > 0]
-        self.bolts = [b for b in self.bolts if b.active]
-        self.enemies = [e for e in self.enemies if e.alive]
-        self.pops = [p for p in self.pops if p.timer < 12]
-        self.orbs = [o for o in self.orbs if o.timer < 250 and o.y > -40]
+        # Remove dead entities (in place, so no new lists are allocated)
+        _compact(fruits, _fruit_alive, self._fruit_pool)
+        _compact(bolts, _bolt_alive, self._bolt_pool)
+        _compact(enemies, _enemy_alive)
+        _compact(pops, _pop_alive, self._pop_pool)
+        _compact(orbs, _orb_alive, self._orb_pool)
         
         # Spawn random fruit
-        if self.timer % 100 == 0 and len(self.pending_enemies + self.enemies) > 0:
-            self.fruits.append(Fruit((randint(70, 730), randint(75, 400)), self))
+        if self.timer % 100 == 0 and (self.pending_enemies or self.enemies):
+            self.spawn_fruit((randint(70, 730), randint(75, 400)))
         
         # Spawn enemies
         if (self.timer % 81 == 0 and 
@@ -154,8 +330,8 @@ class Game:
             self.enemies.append(Robot(pos, robot_type, self))
         
         # Check for level complete
-        if len(self.pending_enemies + self.fruits + self.enemies + self.pops) == 0:
-            if len([orb for orb in self.orbs if orb.trapped_enemy_type is not None]) == 0:
+        if not (self.pending_enemies or self.fruits or self.enemies or self.pops):
+            if not any(orb.trapped_enemy_type is not None for orb in self.orbs):
                 self.next_level()
     
     def draw(self, screen):
@@ -168,24 +344,23 @@ class Game:
         # Draw background
         screen.blit("bg%d" % self.level_colour, (0, 0))
         
-        # Draw blocks
-        block_sprite = "block" + str(self.level % 4)
-        for row_y in range(NUM_ROWS):
-            row = self.grid[row_y]
-            if len(row) > 0:
-                x = LEVEL_X_OFFSET
-                for block_char in row:
-                    if block_char != ' ':
-                        screen.blit(block_sprite, (x, row_y * GRID_BLOCK_SIZE))
-                    x += GRID_BLOCK_SIZE
-        
-        # Draw all entities
-        all_objs = self.fruits + self.bolts + self.enemies + self.pops + self.orbs
+        # Collect blocks and entities, then draw them with a single
+        # batched blit (same surfaces and positions Actor.draw would use)
+        buffer = self._blit_buffer
+        buffer.clear()
+        append = buffer.append
+        
+        block_surf = loaders.images.load(self._block_sprite)
+        for pos in self._block_positions:
+            append((block_surf, pos))
+        
+        for objs in (self.fruits, self.bolts, self.enemies, self.pops, self.orbs):
+            for obj in objs:
+                append((obj._surf, obj.topleft))
         if self.player:
-            all_objs.append(self.player)
+            append((self.player._surf, self.player.topleft))
         
-        for obj in all_objs:
-            obj.draw()
+        screen.surface.blits(buffer, doreturn=False)
     
     def play_sound(self, name, count=1):
         """
@@ -197,10 +372,8 @@ class Game:
         """
         if self.player:
             try:
-                # Access sounds through pgzero's builtins
-                from pgzero import loaders
-                sounds = loaders.sounds
-                sound = getattr(sounds, name + str(randint(0, count - 1)))
+                # Access sounds through pgzero's loaders
+                sound = getattr(loaders.sounds, name + str(randint(0, count - 1)))
                 sound.play()
             except Exception as e:
                 print(f"Sound error: {e}")
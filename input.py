@@ -1,10 +1,19 @@
 # Cavern - Input System
 # Centralized input handling with edge detection (Command Pattern)
 
-from dataclasses import dataclass
+from pgzero.constants import keys
+
+
+# Key constants resolved once. Indexing the keyboard with these is much
+# cheaper than attribute access (keyboard.space), which parses the key
+# name on every read.
+_KEY_LEFT = keys.LEFT
+_KEY_RIGHT = keys.RIGHT
+_KEY_UP = keys.UP
+_KEY_SPACE = keys.SPACE
+_KEY_PAUSE = keys.P
 
 
-@dataclass
 class InputState:
     """
     Snapshot of input state for a single frame.
@@ -12,6 +21,10 @@ class InputState:
     Contains both level (held) and edge (just pressed) input states.
     This replaces direct keyboard access throughout the codebase.
     
+    A plain class with __slots__ rather than a dataclass. InputManager
+    keeps a single instance and overwrites it on every capture(), so
+    callers must not hold on to it beyond the current frame.
+    
     Attributes:
         left: True if left arrow is held
         right: True if right arrow is held
@@ -21,13 +34,25 @@ class InputState:
         fire_held: True while space is held (level)
         pause_pressed: True only on the frame P was first pressed (edge)
     """
-    left: bool = False
-    right: bool = False
-    up: bool = False
-    jump_pressed: bool = False
-    fire_pressed: bool = False
-    fire_held: bool = False
-    pause_pressed: bool = False
+    
+    __slots__ = ('left', 'right', 'up', 'jump_pressed', 'fire_pressed',
+                 'fire_held', 'pause_pressed')
+    
+    def __init__(self, left=False, right=False, up=False, jump_pressed=False,
+                 fire_pressed=False, fire_held=False, pause_pressed=False):
+        """Initialize with the given states (all False by default)."""
+        self.left = left
+        self.right = right
+        self.up = up
+        self.jump_pressed = jump_pressed
+        self.fire_pressed = fire_pressed
+        self.fire_held = fire_held
+        self.pause_pressed = pause_pressed
+    
+    def __repr__(self):
+        fields = ", ".join("%s=%r" % (name, getattr(self, name))
+                           for name in self.__slots__)
+        return "InputState(%s)" % fields
 
 
 class InputManager:
@@ -41,6 +66,9 @@ class InputManager:
     Usage:
         input_manager = InputManager()
         
+        # In on_key_down(key):
+        input_manager.key_down(key)
+        
         # In update loop:
         input_state = input_manager.capture(keyboard)
         game.update(input_state)
@@ -51,6 +79,25 @@ class InputManager:
         self._prev_space = False
         self._prev_up = False
         self._prev_pause = False
+        
+        # Keys pressed since the last capture(), from key_down()
+        self._pressed = set()
+        
+        # Reused every frame rather than allocating a new InputState
+        self._state = InputState()
+    
+    def key_down(self, key):
+        """
+        Record a key press event.
+        
+        The keyboard is only sampled once per frame, so a key pressed and
+        released between two frames would otherwise never be seen. Presses
+        recorded here count as edges on the next capture().
+        
+        Args:
+            key: Pygame Zero key constant from on_key_down
+        """
+        self._pressed.add(key)
     
     def capture(self, keyboard) -> InputState:
         """
@@ -60,24 +107,27 @@ class InputManager:
             keyboard: Pygame Zero keyboard object
         
         Returns:
-            InputState with current level and edge states
+            InputState with current level and edge states. The same
+            object is updated and returned on every call.
         """
         # Read current key states
-        curr_space = keyboard.space
-        curr_up = keyboard.up
-        curr_pause = keyboard.p
+        curr_space = keyboard[_KEY_SPACE]
+        curr_up = keyboard[_KEY_UP]
+        curr_pause = keyboard[_KEY_PAUSE]
         
-        # Build input state with edge detection
-        # Edge = current AND NOT previous (just pressed this frame)
-        state = InputState(
-            left=keyboard.left,
-            right=keyboard.right,
-            up=curr_up,
-            jump_pressed=curr_up and not self._prev_up,
-            fire_pressed=curr_space and not self._prev_space,
-            fire_held=curr_space,
-            pause_pressed=curr_pause and not self._prev_pause
-        )
+        # Fill in input state with edge detection
+        # Edge = current AND NOT previous (just pressed this frame),
+        # or a press recorded by key_down() since the last frame
+        pressed = self._pressed
+        state = self._state
+        state.left = keyboard[_KEY_LEFT]
+        state.right = keyboard[_KEY_RIGHT]
+        state.up = curr_up
+        state.jump_pressed = (curr_up and not self._prev_up) or _KEY_UP in pressed
+        state.fire_pressed = (curr_space and not self._prev_space) or _KEY_SPACE in pressed
+        state.fire_held = curr_space
+        state.pause_pressed = (curr_pause and not self._prev_pause) or _KEY_PAUSE in pressed
+        pressed.clear()
         
         # Store current state for next frame's edge detection
         self._prev_space = curr_space
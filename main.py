@@ -31,7 +31,7 @@ if pgzero_version < [1, 2]:
 # Import our modules
 from app import App
 from input import InputManager
-from screens.menu import MenuScreen
+from utils import preload_images
 
 # Pygame Zero required globals
 WIDTH = 800
@@ -55,8 +55,11 @@ def init():
         # If audio fails, continue without it
         print(f"Audio initialization warning: {e}")
     
+    # Load and convert images before the first frame
+    preload_images()
+    
     # Start at the menu screen
-    app.change_screen(MenuScreen(app))
+    app.change_screen_by_name("menu")
 
 
 # Pygame Zero hook - called every frame
@@ -70,6 +73,16 @@ def update():
     app.update(input_state)
 
 
+# Pygame Zero hook - called for each key press, before update
+def on_key_down(key):
+    """
+    Key press hook (Pygame Zero hook).
+    
+    Records the press so that taps shorter than a frame still register.
+    """
+    input_manager.key_down(key)
+
+
 # Pygame Zero hook - called every frame after update
 def draw():
     """
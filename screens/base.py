@@ -1,19 +1,23 @@
 # Cavern - Base Screen
-# Abstract base class for all screen states
+# Base class for all screen states
 
-from abc import ABC, abstractmethod
 
-
-class BaseScreen(ABC):
+class BaseScreen:
     """
-    Abstract base class for all game screens.
+    Base class for all game screens.
     
     Implements the State pattern - each screen handles its own
     update and draw logic, and the App delegates to the current screen.
     
-    Screens can trigger transitions by calling app.change_screen().
+    Screens trigger transitions by calling app.change_screen_by_name().
+    
+    A plain class rather than an ABC: every screen overrides update()
+    and draw(), so ABCMeta's instantiation checks would only add overhead.
+    Subclasses declare __slots__ for their own state.
     """
     
+    __slots__ = ('app',)
+    
     def __init__(self, app):
         """
         Initialize the screen.
@@ -23,7 +27,6 @@ class BaseScreen(ABC):
         """
         self.app = app
     
-    @abstractmethod
     def update(self, input_state):
         """
         Update the screen state.
@@ -33,7 +36,6 @@ class BaseScreen(ABC):
         """
         pass
     
-    @abstractmethod
     def draw(self, screen):
         """
         Draw the screen.
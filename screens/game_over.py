@@ -13,6 +13,8 @@ class GameOverScreen(BaseScreen):
     Pressing SPACE returns to the menu.
     """
     
+    __slots__ = ('game',)
+    
     def __init__(self, app, game):
         """
         Initialize the game over screen.
@@ -35,8 +37,7 @@ class GameOverScreen(BaseScreen):
         """
         if input_state.fire_pressed:
             # Return to menu
-            from screens.menu import MenuScreen
-            self.app.change_screen(MenuScreen(self.app))
+            self.app.change_screen_by_name("menu")
     
     def draw(self, screen):
         """
@@ -2,7 +2,11 @@
 # Title screen with "Press SPACE" prompt
 
 from screens.base import BaseScreen
-from game import Game
+
+
+# "Press SPACE" image for each step of its 160-frame cycle. The animation
+# has 10 frames (0-9) and stays on frame 9 for most of the time.
+_SPACE_FRAMES = ["space" + str(min(((t + 40) % 160) // 4, 9)) for t in range(160)]
 
 
 class MenuScreen(BaseScreen):
@@ -15,6 +19,8 @@ class MenuScreen(BaseScreen):
     Pressing SPACE transitions to PlayScreen.
     """
     
+    __slots__ = ('game',)
+    
     def __init__(self, app):
         """
         Initialize the menu screen.
@@ -23,8 +29,8 @@ class MenuScreen(BaseScreen):
             app: Reference to the App instance
         """
         super().__init__(app)
-        # Create a background game without a player for animations
-        self.game = Game(player=None)
+        # Background game without a player for animations
+        self.game = app.new_game(with_player=False)
     
     def update(self, input_state):
         """
@@ -38,8 +44,7 @@ class MenuScreen(BaseScreen):
         """
         if input_state.fire_pressed:
             # Start the game - transition to PlayScreen
-            from screens.play import PlayScreen
-            self.app.change_screen(PlayScreen(self.app))
+            self.app.change_screen_by_name("play")
         else:
             # Update background game for animations
             self.game.update(None)
@@ -58,6 +63,4 @@ class MenuScreen(BaseScreen):
         screen.blit("title", (0, 0))
         
         # Draw "Press SPACE" animation
-        # Animation has 10 frames (0-9), stays on frame 9 for most of the time
-        anim_frame = min(((self.game.timer + 40) % 160) // 4, 9)
-        screen.blit("space" + str(anim_frame), (130, 280))
+        screen.blit(_SPACE_FRAMES[self.game.timer % 160], (130, 280))
@@ -4,9 +4,7 @@
 import pygame
 
 from screens.base import BaseScreen
-from game import Game
-from actors import Player
-from utils import draw_status, draw_text
+from utils import draw_status, text_surface, text_width
 from constants import WIDTH, HEIGHT
 
 
@@ -14,30 +12,34 @@ class PlayScreen(BaseScreen):
     """
     Main gameplay screen.
     
-    Owns the Game and Player instances. Handles:
+    Runs the Game and Player for a playthrough. Handles:
     - Normal gameplay updates
     - Pause toggling with P key
     - Transition to GameOverScreen when player dies
     
-    Game and Player are created HERE, not in global scope.
+    Game and Player are owned by the App and reset here for each new
+    game, not kept in global scope.
     """
     
+    __slots__ = ('player', 'game', 'paused')
+    
+    # Semi-transparent pause overlay, created on first pause and shared
+    _pause_overlay = None
+    
     def __init__(self, app):
         """
         Initialize the play screen.
         
-        Creates a new Game with a new Player.
+        Starts a new game with a player, reusing the App's Game and Player.
         
         Args:
             app: Reference to the App instance
         """
         super().__init__(app)
         
-        # Create player first (game reference set after)
-        self.player = Player(game=None)
-        
-        # Create game with the player
-        self.game = Game(player=self.player)
+        # Start a game with the player
+        self.game = app.new_game(with_player=True)
+        self.player = self.game.player
         
         # Set the game reference on the player (back-reference)
         self.player.game = self.game
@@ -68,8 +70,7 @@ class PlayScreen(BaseScreen):
         # Check for game over
         if self.game.player.lives < 0:
             self.game.play_sound("over")
-            from screens.game_over import GameOverScreen
-            self.app.change_screen(GameOverScreen(self.app, self.game))
+            self.app.change_screen_by_name("game_over", self.game)
             return
         
         # Normal game update
@@ -103,10 +104,14 @@ class PlayScreen(BaseScreen):
         Args:
             screen: Pygame Zero screen object
         """
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))  # Black with 50% transparency
+        # Create semi-transparent overlay once, then reuse it
+        overlay = PlayScreen._pause_overlay
+        if overlay is None:
+            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 128))  # Black with 50% transparency
+            overlay = PlayScreen._pause_overlay = overlay.convert_alpha()
         screen.surface.blit(overlay, (0, 0))
         
         # Draw "PAUSED" text centered
-        draw_text(screen, "PAUSED", HEIGHT // 2 - 20)
+        x = (WIDTH - text_width("PAUSED")) // 2
+        screen.blit(text_surface("PAUSED"), (x, HEIGHT // 2 - 20))
@@ -0,0 +1,15 @@
+# Cavern - Screen Registry
+# Maps screen names to screen classes for App.change_screen_by_name()
+
+from screens.menu import MenuScreen
+from screens.play import PlayScreen
+from screens.game_over import GameOverScreen
+
+
+# Screens look each other up here by name instead of importing each
+# other, which would be circular
+SCREENS = {
+    "menu": MenuScreen,
+    "play": PlayScreen,
+    "game_over": GameOverScreen,
+}
@@ -1,35 +1,52 @@
 # Cavern - Utility Functions
 # Helper functions extracted from original cavern.py
 
+import pygame
+from pgzero import loaders
+
 from constants import (
     WIDTH, HEIGHT, NUM_ROWS, NUM_COLUMNS,
     LEVEL_X_OFFSET, GRID_BLOCK_SIZE, CHAR_WIDTH, IMAGE_WIDTH
 )
 
 
-def block(x, y, grid):
+def flatten_grid(grid):
+    """
+    Pack a level grid into a single bytes object for block().
+    
+    Rows are padded with spaces to NUM_COLUMNS, so the character for
+    row r, column c is at index r * NUM_COLUMNS + c.
+    
+    Args:
+        grid: Level grid (list of strings)
+    
+    Returns:
+        bytes of length len(grid) * NUM_COLUMNS
+    """
+    return "".join(row.ljust(NUM_COLUMNS) for row in grid).encode("ascii")
+
+
+def block(x, y, grid_flat, _x_offset=LEVEL_X_OFFSET, _size=GRID_BLOCK_SIZE,
+          _rows=NUM_ROWS, _columns=NUM_COLUMNS):
     """
     Check if there's a level grid block at the given coordinates.
     
     Args:
         x: X coordinate in pixels
         y: Y coordinate in pixels
-        grid: The current level grid (list of strings)
+        grid_flat: The current level grid, as returned by flatten_grid()
+        _x_offset, _size, _rows, _columns: Not for callers; bind the
+            grid constants as fast locals
     
     Returns:
         True if there's a block at this position, False otherwise
     """
-    grid_x = (x - LEVEL_X_OFFSET) // GRID_BLOCK_SIZE
-    grid_y = y // GRID_BLOCK_SIZE
+    grid_x = (x - _x_offset) // _size
+    grid_y = y // _size
     
-    if grid_y > 0 and grid_y < NUM_ROWS:
-        row = grid[grid_y]
-        return (grid_x >= 0 and 
-                grid_x < NUM_COLUMNS and 
-                len(row) > 0 and 
-                row[grid_x] != " ")
-    else:
-        return False
+    if 0 < grid_y < _rows and 0 <= grid_x < _columns:
+        return grid_flat[grid_y * _columns + grid_x] != 32  # ord(" ")
+    return False
 
 
 def sign(x):
@@ -64,25 +81,108 @@ def char_width(char):
     return CHAR_WIDTH[0]
 
 
-def draw_text(screen, text, y, x=None):
+# (width, image name) for each printable ASCII character, so drawing text
+# doesn't redo the width and name calculations for every glyph.
+# Font images are named font0XX where XX is the ASCII code.
+_GLYPHS = {chr(code): (char_width(chr(code)), "font0" + str(code))
+           for code in range(32, 128)}
+
+# Characters the bitmap font has images for
+_FONT_CHARS = " 0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Status bar and screen overlay images, drawn every frame
+_HUD_IMAGES = (["life", "plus", "health", "title", "over"]
+               + ["space" + str(i) for i in range(10)])
+
+# Backgrounds have no transparent pixels, so they are converted without
+# an alpha channel - blitting them is then a plain copy
+_OPAQUE_IMAGES = ["bg0", "bg1", "bg2", "bg3"]
+
+# Rendered text surfaces, keyed by the text string
+_text_surfaces = {}
+
+# The last score drawn and its rendered surface. The score takes too many
+# values to keep them all in _text_surfaces, but changes only on pickups.
+_score_cache = {"value": None, "surface": None, "x": None}
+
+# The level whose "LEVEL N" label was last drawn, and the label's
+# (surface, position) blit. Rebuilt only when the level changes, and kept
+# out of _text_surfaces for the same reason as the score.
+_level_text_cache = {"level": None, "blit": None}
+
+# (surface, position) blits for the status bar icons, keyed by
+# (lives, health). Only a handful of combinations ever occur.
+_life_patterns = {}
+
+
+def preload_images():
+    """
+    Load the font, HUD and background images up front.
+    
+    pgzero loads images on first use (already converted with
+    convert_alpha()), which would otherwise happen mid-game. The opaque
+    backgrounds are stored in pgzero's image cache converted without
+    alpha instead. Must be called after the display has been created.
+    """
+    images = loaders.images
+    for name in _OPAQUE_IMAGES:
+        images.cache[images.cache_key(name, (), {})] = images.load(name).convert()
+    for name in _HUD_IMAGES:
+        images.load(name)
+    for char in _FONT_CHARS:
+        images.load(_GLYPHS[char][1])
+
+
+def text_width(text):
     """
-    Draw text on screen using the game's bitmap font.
+    Return the width of text in the game's bitmap font.
+    
+    This is the sum of the character advances, which is what text is
+    centered by (some glyph images are slightly wider than their advance).
     
     Args:
-        screen: Pygame Zero screen object
-        text: String to draw
-        y: Y coordinate
-        x: X coordinate (if None, text is centered)
+        text: String to measure
+    
+    Returns:
+        Width in pixels
     """
-    if x is None:
-        # Center text horizontally
-        total_width = sum(char_width(c) for c in text)
-        x = (WIDTH - total_width) // 2
+    return sum(_GLYPHS[c][0] for c in text)
+
+
+def text_surface(text):
+    """
+    Return a Surface with text rendered in the game's bitmap font.
+    
+    Surfaces are cached by text for the life of the program, so this is
+    for fixed strings, which can then be drawn with a single blit instead
+    of one blit per glyph.
     
+    Args:
+        text: String to render
+    
+    Returns:
+        pygame.Surface with per-pixel alpha
+    """
+    surf = _text_surfaces.get(text)
+    if surf is None:
+        surf = _text_surfaces[text] = _render_text(text)
+    return surf
+
+
+def _render_text(text):
+    """Render text into a new alpha Surface, one blit per glyph."""
+    glyphs = []
+    x = 0
     for char in text:
-        # Font images are named font0XX where XX is the ASCII code
-        screen.blit("font0" + str(ord(char)), (x, y))
-        x += char_width(char)
+        width, name = _GLYPHS[char]
+        glyphs.append((loaders.images.load(name), (x, 0)))
+        x += width
+    # Some glyphs are slightly wider than their advance
+    size = (max([x] + [pos[0] + image.get_width() for image, pos in glyphs]),
+            max([1] + [image.get_height() for image, _ in glyphs]))
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    surf.blits(glyphs, doreturn=False)
+    return surf
 
 
 def draw_status(screen, player, level):
@@ -94,23 +194,50 @@ def draw_status(screen, player, level):
         player: Player object with score, lives, health attributes
         level: Current level number
     """
+    # Everything is collected into one list and submitted to pygame in a
+    # single blits() call
+    
     # Display score, right-justified at edge of screen
-    number_width = CHAR_WIDTH[0]
-    score_str = str(player.score)
-    draw_text(screen, score_str, 451, WIDTH - 2 - (number_width * len(score_str)))
+    # (re-rendered only when it changes)
+    score = player.score
+    if score != _score_cache["value"]:
+        score_str = str(score)
+        _score_cache["value"] = score
+        _score_cache["surface"] = _render_text(score_str)
+        _score_cache["x"] = WIDTH - 2 - (CHAR_WIDTH[0] * len(score_str))
+    hud = [(_score_cache["surface"], (_score_cache["x"], 451))]
     
-    # Display level number
-    draw_text(screen, "LEVEL " + str(level + 1), 451)
+    # Display level number, centered (cached - it only changes between levels)
+    if level != _level_text_cache["level"]:
+        level_text = "LEVEL " + str(level + 1)
+        x = (WIDTH - text_width(level_text)) // 2
+        _level_text_cache["level"] = level
+        _level_text_cache["blit"] = (_render_text(level_text), (x, 451))
+    hud.append(_level_text_cache["blit"])
     
     # Display lives and health icons
+    key = (player.lives, player.health)
+    pattern = _life_patterns.get(key)
+    if pattern is None:
+        pattern = _life_patterns[key] = _life_pattern(*key)
+    hud.extend(pattern)
+    
+    screen.surface.blits(hud, doreturn=False)
+
+
+def _life_pattern(lives, health):
+    """Build the (surface, position) blits for the lives and health icons."""
     # Only display a maximum of two lives - if there are more, show a plus symbol
-    lives_health = ["life"] * min(2, player.lives)
-    if player.lives > 2:
-        lives_health.append("plus")
-    if player.lives >= 0:
-        lives_health += ["health"] * player.health
+    images = ["life"] * min(2, lives)
+    if lives > 2:
+        images.append("plus")
+    if lives >= 0:
+        images += ["health"] * health
     
+    load = loaders.images.load
+    pattern = []
     x = 0
-    for image in lives_health:
-        screen.blit(image, (x, 450))
+    for image in images:
+        pattern.append((load(image), (x, 450)))
         x += IMAGE_WIDTH[image]
+    return tuple(pattern)